@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import pytest
+
+from toggl_git_python_utility import util
+from toggl_git_python_utility.config_func import (
+    EMAIL_PATTERN,
+    ConfigManager,
+    ConfigModel,
+    GitConfig,
+    PythonConfig,
+    TogglAuth,
+    TogglConfig,
+    build_config,
+)
+
+
+def config_data(project=1234) -> dict:
+    return {
+        "target_directory": "repo",
+        "python": {"package_manager": "Poetry", "main_code": "src"},
+        "git": {"add": True, "commit": True, "push": False},
+        "toggl": {
+            "user_data": {"username": "user@example.com", "password": "cA=="},
+            "project": project,
+            "cancel": True,
+        },
+    }
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> ConfigManager:
+    config = ConfigManager(load=False)
+    config.config_file_path = tmp_path / "configuration.json"
+    return config
+
+
+def test_build_config():
+    config = build_config(config_data())
+
+    assert isinstance(config, ConfigModel)
+    assert config.target_directory == Path("repo")
+    assert config.python.package_manager == "Poetry"
+    assert config.python.main_code == Path("src")
+    assert config.git == GitConfig(add=True, commit=True, push=False)
+    assert config.toggl.user_data == TogglAuth("user@example.com", "cA==")
+    assert config.toggl.project == 1234
+    assert config.toggl.cancel is True
+
+
+def test_build_config_null_project():
+    config = build_config(config_data(project=None))
+
+    assert config.toggl.project is None
+
+
+def test_build_config_round_trip():
+    config = ConfigModel(
+        target_directory=Path("repo"),
+        python=PythonConfig(tests="Pytest"),
+        git=GitConfig(),
+        toggl=TogglConfig(user_data=TogglAuth("user@example.com", "cA==")),
+    )
+
+    assert build_config(util.json_loads(util.json_dumps(config))) == config
+
+
+def test_load_config(manager: ConfigManager):
+    manager.config_file_path.write_bytes(util.json_dumps(config_data()))
+
+    manager.load_config()
+
+    assert manager.config == build_config(config_data())
+
+
+def test_load_config_missing_file(manager: ConfigManager):
+    with pytest.raises(FileNotFoundError):
+        manager.load_config()
+
+
+def test_load_config_missing_section(manager: ConfigManager):
+    data = config_data()
+    del data["git"]
+    manager.config_file_path.write_bytes(util.json_dumps(data))
+
+    with pytest.raises(ValueError):
+        manager.load_config()
+
+
+@pytest.mark.parametrize(
+    "email",
+    ["user@example.com", "first.last@example.co.uk", "a-b_c@mail-host.io"],
+)
+def test_email_pattern_valid(email: str):
+    assert EMAIL_PATTERN.fullmatch(email)
+
+
+@pytest.mark.parametrize(
+    "email",
+    ["user@example", "user|name@example.com", "@example.com", "user@.com"],
+)
+def test_email_pattern_invalid(email: str):
+    assert EMAIL_PATTERN.fullmatch(email) is None
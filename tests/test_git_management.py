@@ -0,0 +1,28 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from toggl_git_python_utility.__main__ import GitManagement, NotAGitRepoError
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("git") is None, reason="git is not installed"
+)
+
+
+def test_run_git_outside_repo(tmp_path: Path):
+    git_obj = GitManagement(tmp_path)
+
+    with pytest.raises(NotAGitRepoError):
+        git_obj._run_git(["git", "status"])
+
+    assert git_obj.check_git_repo() is False
+
+
+def test_check_git_repo(tmp_path: Path):
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    git_obj = GitManagement(tmp_path)
+
+    assert git_obj.check_git_repo() is True
+    assert git_obj._run_git(["git", "status", "--short"]) == b""
@@ -0,0 +1,104 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from toggl_git_python_utility import __main__ as main_module
+from toggl_git_python_utility.__main__ import TgglApi, TgglTracker
+
+TRACKER = TgglTracker(1, 2, "Write tests")
+
+
+def make_api(email: str = "user@example.com") -> TgglApi:
+    # Skips __init__, so no session or requests import is needed.
+    api = TgglApi.__new__(TgglApi)
+    api.email = email
+    return api
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path, monkeypatch) -> Path:
+    path = tmp_path / "toggl_git" / "last_entry.json"
+    monkeypatch.setattr(main_module, "entry_cache_path", lambda: path)
+    return path
+
+
+@pytest.fixture
+def clock(monkeypatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(main_module.time, "time", lambda: now[0])
+    return now
+
+
+def test_cached_entry_round_trip(cache_path: Path, clock: list[float]):
+    api = make_api()
+    api._write_cached_entry(TRACKER, 5)
+
+    assert cache_path.exists()
+    assert api._read_cached_entry() == TRACKER
+    assert api._read_cached_entry(5) == TRACKER
+
+
+def test_cached_entry_expires(cache_path: Path, clock: list[float]):
+    api = make_api()
+    api._write_cached_entry(TRACKER, 5)
+
+    clock[0] += TgglApi.CACHE_TTL
+
+    assert api._read_cached_entry() is None
+
+
+def test_cached_entry_other_account(cache_path: Path, clock: list[float]):
+    make_api()._write_cached_entry(TRACKER, 5)
+
+    assert make_api("other@example.com")._read_cached_entry() is None
+
+
+def test_cached_entry_other_project(cache_path: Path, clock: list[float]):
+    api = make_api()
+    api._write_cached_entry(TRACKER, None)
+
+    assert api._read_cached_entry(5) is None
+
+
+def test_cached_entry_without_email(cache_path: Path, clock: list[float]):
+    api = make_api()
+    api._write_cached_entry(TRACKER, 5)
+    data = main_module.util.json_loads(cache_path.read_bytes())
+    del data["email"]
+    cache_path.write_bytes(main_module.util.json_dumps(data))
+
+    assert api._read_cached_entry() is None
+
+
+def test_stop_clears_cached_entry(cache_path: Path, clock: list[float]):
+    api = make_api()
+    api._write_cached_entry(TRACKER, 5)
+    api.session = SimpleNamespace(
+        patch=lambda *_, **__: SimpleNamespace(status_code=200)
+    )
+
+    assert api.stop_tggl_time_entry(TRACKER.workspace_id, TRACKER.entry_id)
+    assert not cache_path.exists()
+
+
+def test_failed_stop_keeps_cached_entry(cache_path: Path, clock: list[float]):
+    api = make_api()
+    api._write_cached_entry(TRACKER, 5)
+    api.session = SimpleNamespace(
+        patch=lambda *_, **__: SimpleNamespace(status_code=500)
+    )
+
+    assert not api.stop_tggl_time_entry(TRACKER.workspace_id, TRACKER.entry_id)
+    assert cache_path.exists()
+
+
+def test_unresolvable_home(monkeypatch, clock: list[float]):
+    def no_home() -> Path:
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.setattr(main_module, "entry_cache_path", no_home)
+    api = make_api()
+    api._write_cached_entry(TRACKER, 5)
+
+    assert api._read_cached_entry() is None
@@ -0,0 +1,73 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from toggl_git_python_utility import util
+from toggl_git_python_utility.config_func import GitConfig
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(util, "orjson", None)
+    return request.param
+
+
+def test_json_dumps_compact(json_backend):
+    data = util.json_dumps({"path": Path("src"), "git": GitConfig()})
+
+    assert data == (
+        b'{"path":"src","git":{"add":false,"commit":true,"push":false}}\n'
+    )
+
+
+def test_json_dumps_indent(json_backend):
+    data = util.json_dumps({"a": [1, 2]}, indent=True)
+
+    assert data.endswith(b"\n")
+    assert util.json_loads(data) == {"a": [1, 2]}
+    assert b"\n  " in data
+
+
+def test_json_dumps_unknown_type(json_backend):
+    with pytest.raises(TypeError):
+        util.json_dumps({"value": object()})
+
+
+def test_json_loads(json_backend):
+    assert util.json_loads(b'{"a": null, "b": [1.5]}') == {
+        "a": None,
+        "b": [1.5],
+    }
+
+
+def test_run_sub_command_stream_invalid_utf8():
+    cmd = [sys.executable, "-c", "import os; os.write(1, b'ok\\xff\\n')"]
+
+    assert list(util.run_sub_command_stream(cmd)) == ["ok\ufffd\n"]
+
+
+def test_run_sub_command_stream_blocks_dont_interleave(capsys):
+    code = (
+        "import sys, time\n"
+        "for i in range(5):\n"
+        "    print(sys.argv[1], i, flush=True)\n"
+        "    time.sleep(0.01)\n"
+    )
+
+    def run(name: str) -> list[str]:
+        cmd = [sys.executable, "-c", code, name]
+        return list(util.run_sub_command_stream(cmd))
+
+    with ThreadPoolExecutor(2) as pool:
+        results = list(pool.map(run, ["TESTS", "BANDIT"]))
+
+    assert results[0] == [f"TESTS {i}\n" for i in range(5)]
+    output = capsys.readouterr().out
+    for name in ("TESTS", "BANDIT"):
+        block = "".join(f"{name} {i}\n" for i in range(5))
+        assert block in output
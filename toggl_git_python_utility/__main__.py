@@ -3,15 +3,17 @@ Main module resposible for running all the tasks in the right containing
 most of the main funtions at the moment.
 """
 from __future__ import annotations
-from typing import NamedTuple, Optional, Literal, Final
+from typing import Any, Callable, NamedTuple, Optional, Literal, Final
 
 import sys
-import os
 from pathlib import Path
 import logging
+import re
+import time
 from base64 import b64encode, b64decode
-
-import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from functools import lru_cache
 
 from toggl_git_python_utility.config_func import (
     ConfigManager,
@@ -23,6 +25,11 @@ from toggl_git_python_utility import util
 
 APP_NAME = "Python, Git & Toggl Tracker Utility"
 
+logger = logging.getLogger(__name__)
+
+# Bandit severities which cancel the commit.
+SEVERITY_PATTERN = re.compile(r"Severity: (?:High|Critical)")
+
 
 class TgglTracker(NamedTuple):
     """Tuple for holding current tracker information while executing the
@@ -41,6 +48,38 @@ class NotTrackingerror(TrackerError):
     """Exception if a user is not tracking on Toggl."""
 
 
+class NotAGitRepoError(Exception):
+    """Exception if git is run outside of a git repository."""
+
+
+@lru_cache(maxsize=8)
+def basic_auth_header(email: str, b64_password: str) -> bytes:
+    """Builds the basic authorization header from the stored credentials.
+    Stays in bytes throughout as requests accepts bytes header values.
+
+    Args:
+        email (str): Email of the Toggl account.
+        b64_password (str): Base64 encoded password as stored in the config.
+
+    Returns:
+        bytes: Header value in the form of b'Basic <credentials>'.
+    """
+    credentials = email.encode() + b":" + b64decode(b64_password)
+    return b"Basic " + b64encode(credentials)
+
+
+@lru_cache(maxsize=1)
+def entry_cache_path() -> Path:
+    """Location of the last grabbed time entry. Resolved on first use, so an
+    unresolvable home directory only disables the cache instead of breaking
+    the import.
+
+    Raises:
+        RuntimeError: If the home directory can't be resolved.
+    """
+    return Path.home() / ".cache" / "toggl_git" / "last_entry.json"
+
+
 class TgglApi:
     """Setup for dealing with the Toggl API.
 
@@ -54,24 +93,53 @@ class TgglApi:
             the configuration given.
         stop_tggl_time_entry: Stops the toggl entry with an id and other info
             given.
+        close: Closes the underlying session and its pooled connections.
+
+    Attributes:
+        CACHE_TTL (int): Seconds a cached time entry is reused for instead of
+            asking the api again.
     """
 
-    BASE_URL: Final[str] = r"https://api.track.toggl.com/api/v9"
+    __slots__ = ("email", "auth_encode", "headers", "session")
+
+    BASE_URL: Final[str] = "https://api.track.toggl.com/api/v9"
+    CURRENT_URL: Final[str] = BASE_URL + "/me/time_entries/current"
+    STOP_URL_FMT: Final[str] = (
+        BASE_URL + "/workspaces/{}/time_entries/{}/stop"
+    )
+    CACHE_TTL: Final[int] = 15
 
     def __init__(self, auth_token: TogglConfig) -> None:
         user_data = auth_token.user_data
         self.email = user_data.username
-
-        password = b64decode(user_data.password).decode("utf-8")
-
-        auth_txt = f"{self.email}:{password}"
-        decode = b64encode(bytes(auth_txt, "utf-8")).decode("ascii")
-        self.auth_encode = f"Basic {decode}"
+        self.auth_encode = basic_auth_header(self.email, user_data.password)
         self.headers = {
             "content-type": "application/json",
             "Authorization": self.auth_encode,
         }
 
+        # Imported here as requests is slow to import and only needed once
+        # the configuration has been loaded successfully.
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        # Keep-alive session so consecutive calls reuse the same connection.
+        self.session = requests.Session()
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        )
+        self.session.headers.update(self.headers)
+
+    def __enter__(self) -> TgglApi:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the session and releases any pooled connections."""
+        self.session.close()
+
     def grab_tggl_time_entry(
         self, 
         project_id: Optional[int] = None
@@ -91,20 +159,22 @@ class TgglApi:
         Returns:
             TgglTracker: Current tracker information.
         """
-        logging.info("Grabbing current Toggl time entry for user %s",
-                     self.email)
-        response = requests.get(
-            self.BASE_URL + "/me/time_entries/current",
-            headers=self.headers,
-            timeout=20
-        )
+        cached = self._read_cached_entry(project_id)
+        if cached is not None:
+            logger.info("Using the cached Toggl time entry %s.",
+                        cached.entry_id)
+            return cached
+
+        logger.info("Grabbing current Toggl time entry for user %s",
+                    self.email)
+        response = self.session.get(self.CURRENT_URL, timeout=20)
         code = response.status_code
         if code != 200:
-            logging.error("Failed to connect to tggl api.")
-            logging.error("Response Code: %s", code)
+            logger.error("Failed to connect to tggl api.")
+            logger.error("Response Code: %s", code)
             raise ConnectionError(code)
 
-        content = response.json()
+        content = util.json_loads(response.content)
         if not isinstance(content, dict):
             raise NotTrackingerror("Specified user is not tracking atm.")
 
@@ -115,9 +185,48 @@ class TgglApi:
         tracker = TgglTracker(
             content["id"], content["workspace_id"], content["description"]
         )
+        self._write_cached_entry(tracker, tracker_project_id)
 
         return tracker
 
+    def _read_cached_entry(
+        self,
+        project_id: Optional[int] = None
+    ) -> Optional[TgglTracker]:
+        """Returns the last grabbed entry if it is recent enough and was
+        fetched by the same account for the same project id, otherwise None.
+        """
+        try:
+            data = util.json_loads(entry_cache_path().read_bytes())
+            if time.time() - data["fetched_at"] >= self.CACHE_TTL:
+                return None
+            if data["email"] != self.email:
+                return None
+            if project_id is not None and project_id != data["project_id"]:
+                return None
+            return TgglTracker(
+                data["entry_id"], data["workspace_id"], data["description"]
+            )
+        except (OSError, RuntimeError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_cached_entry(
+        self,
+        tracker: TgglTracker,
+        project_id: Optional[int]
+    ):
+        """Stores the grabbed entry for the next run to reuse."""
+        data = tracker._asdict()
+        data["email"] = self.email
+        data["project_id"] = project_id
+        data["fetched_at"] = time.time()
+        try:
+            cache_path = entry_cache_path()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(util.json_dumps(data))
+        except (OSError, RuntimeError):
+            logger.warning("Failed to cache the current time entry.")
+
     def stop_tggl_time_entry(
         self,
         workspace_id: int,
@@ -132,17 +241,21 @@ class TgglApi:
         Returns:
             bool: Returns True if the entry is stopped else False
         """
-        logging.info("Stopping time tracker with id %s.", time_entry_id)
-        url = self.BASE_URL
-        url += f"/workspaces/{workspace_id}/time_entries/{time_entry_id}/stop"
-        response = requests.patch(url, headers=self.headers, timeout=20)
+        logger.info("Stopping time tracker with id %s.", time_entry_id)
+        url = self.STOP_URL_FMT.format(workspace_id, time_entry_id)
+        response = self.session.patch(url, timeout=20)
 
         code = response.status_code
         if code != 200:
-            logging.error("Failed to stop time entry.")
-            logging.error("Response: %s", {code})
+            logger.error("Failed to stop time entry.")
+            logger.error("Response: %s", code)
             return False
 
+        # The entry isn't running anymore, so it shouldn't be reused.
+        try:
+            entry_cache_path().unlink(missing_ok=True)
+        except (OSError, RuntimeError):
+            logger.warning("Failed to clear the cached time entry.")
         return True
 
 
@@ -154,18 +267,34 @@ class GitManagement:
 
     Args:
         path (path, optional): Chosen path for the selected git reposityory.
+
+    Raises:
+        NotAGitRepoError: If a git command is run outside of a repository.
     """
 
+    __slots__ = ("path", "_is_repo")
+
     def __init__(self, path: Path = Path(".")) -> None:
         self.path = path if path is not None else Path(".")
-        if path is not None and path != Path("."):
-            os.chdir(path)
+        self._is_repo: Optional[bool] = None
+
+    def _run_git(self, command: list[str]) -> bytes:
+        """Runs a git command and flags if the path isn't a git repository.
+        Git exits with 128 in that case, which saves a separate check.
+        """
+        result = util.run_sub_process(command, self.path)
+        not_repo = b"not a git repository" in result.stderr
+        if result.returncode == 128 and not_repo:
+            self._is_repo = False
+            raise NotAGitRepoError(self.path)
+
+        return result.stdout
 
     def add_files(self) -> None:
         """Adds all files to version control."""
-        logging.info("Adding files to version control.")
-        command = "git add ."
-        util.run_sub_command(command)
+        logger.info("Adding files to version control.")
+        command = ["git", "add", "."]
+        self._run_git(command)
 
     def create_commit(self, message: str) -> None:
         """Creates a commit with the message specified.
@@ -174,9 +303,33 @@ class GitManagement:
             message (str): Message to be used for the commit.
         """
         message = message.title()
-        logging.info("Creating a git commit with message: %s.", message)
-        command = f'git commit -m "{message}"'
-        util.run_sub_command(command)
+        logger.info("Creating a git commit with message: %s.", message)
+        command = ["git", "commit", "-m", message]
+        self._run_git(command)
+
+    def commit_all(
+        self,
+        message: str,
+        include_untracked: bool = False
+    ) -> None:
+        """Commits all changes with the message specified. Tracked changes are
+        staged by the commit itself, so git only runs once unless untracked
+        files have to be added first.
+
+        Args:
+            message (str): Message to be used for the commit.
+            include_untracked (bool, optional): Adds untracked files as well.
+                Defaults to False.
+        """
+        if include_untracked:
+            self.add_files()
+            self.create_commit(message)
+            return
+
+        message = message.title()
+        logger.info("Creating a git commit with message: %s.", message)
+        command = ["git", "commit", "-a", "-m", message]
+        self._run_git(command)
 
     def push_to_remote_repo(self, branch: str = "main") -> None:
         """Pushes current repo to the specificed branch.
@@ -185,18 +338,60 @@ class GitManagement:
             branch (str, optional): Custom git branch to be commited to if
                 needed. Defaults to "main".
         """
-        command = f"git push origin {branch}"
-        util.run_sub_command(command)
+        command = ["git", "push", "origin", branch]
+        self._run_git(command)
+
+    def commit_and_push(
+        self,
+        message: str,
+        add: bool = False,
+        commit: bool = True,
+        push: bool = False,
+        branch: str = "main",
+    ) -> None:
+        """Runs the configured add, commit and push steps in one go.
+
+        Args:
+            message (str): Message to be used for the commit.
+            add (bool, optional): Adds all files before commiting.
+                Defaults to False.
+            commit (bool, optional): Creates the commit. Defaults to True.
+            push (bool, optional): Pushes to the remote afterwards.
+                Defaults to False.
+            branch (str, optional): Custom git branch to be pushed to.
+                Defaults to "main".
+        """
+        if commit:
+            self.commit_all(message, include_untracked=add)
+        elif add:
+            self.add_files()
+
+        if push:
+            self.push_to_remote_repo(branch)
 
     def check_git_repo(self) -> bool:
         """Checks the current folder for a git repository.
 
+        The result is remembered so repeated checks don't spawn git again.
+
         Returns:
             bool: True if the chosen folder is a git repository.
         """
-        is_git_repo = "git rev-parse --is-inside-work-tree"
-        output = util.run_sub_command(is_git_repo)
-        return "true" in output
+        if self._is_repo is not None:
+            return self._is_repo
+
+        # A .git folder or file covers nearly every case without spawning git.
+        if (self.path / ".git").exists():
+            self._is_repo = True
+            return True
+
+        is_git_repo = ["git", "rev-parse", "--is-inside-work-tree"]
+        result = util.run_sub_process(is_git_repo, self.path, echo=False)
+        if result.returncode != 0:
+            self._is_repo = False
+        else:
+            self._is_repo = result.stdout.strip() == b"true"
+        return self._is_repo
 
 
 class CodeManagement:
@@ -205,10 +400,6 @@ class CodeManagement:
     *Will want to expand this to run the actual python modules themselves in
     the future for more configurability.
 
-    Attributes:
-        SEVERITY_MATCH (set): For matching and cancelling commits if security
-            issure are to severe.
-
     Args:
         config (PythonConfig): User set configuration which determines what
             gets executed.
@@ -218,9 +409,12 @@ class CodeManagement:
     Methods:
         run_management_routine: Runs the entire object depening on the config
             supplied.
+        run_checks: Runs the tests and the checks that don't modify code.
+        run_pipeline: Runs the stages that write to the project.
         test_code: Runs avaiable tests witht the chosen testing configuration.
         lint_code: Lints the code with the configured linter.
         format_code: Formats the code with a supplied formatter.
+        ruff_code: Formats and lints the code when Ruff handles both.
         type_check_code: Type Checks the code with the given module.
         generate_requirements: Creates a config file with the given package/env
             manager.
@@ -228,47 +422,93 @@ class CodeManagement:
             checks.
     """
 
-    SEVERITY_MATCH: Final[set[str]] = {"High", "Critical"}
+    __slots__ = (
+        "path",
+        "config",
+        "package_manager",
+        "code_location",
+        "_target",
+        "_checks",
+        "_pipeline",
+    )
 
     def __init__(self, config: PythonConfig, path: Path = Path(".")) -> None:
         self.path = path
-        if path.exists() and path != Path("."):
-            os.chdir(path)
-
         self.config = config
         self.package_manager = config.package_manager
         self.code_location = self.config.main_code
+        self._target = str(Path(self.code_location))
+
+        # Stages paired with their argument, skipping anything the config
+        # disables. Checks don't modify the code so they run in parallel with
+        # the tests, the pipeline stages rewrite it and run in order after.
+        linter: Optional[str] = config.linting
+        formatter = config.formatter if config.format_code else None
+        ruff = None
+        if linter == formatter == "Ruff":
+            # Covered by a single ruff stage instead.
+            ruff, linter, formatter = "Ruff", None, None
+
+        checks: tuple[tuple[Any, Callable[[Any], None]], ...] = (
+            (config.type_checking, lambda _: self.type_check_code()),
+            (linter, self.lint_code),
+            (config.security_checking, self.security_check),
+        )
+        self._checks = [check for check in checks if check[0] is not None]
+
+        stages: tuple[tuple[Any, Callable[[Any], None]], ...] = (
+            (formatter, self.format_code),
+            (ruff, lambda _: self.ruff_code()),
+            (self.package_manager, lambda _: self.generate_requirements()),
+        )
+        self._pipeline = [stage for stage in stages if stage[0] is not None]
 
     def run_management_routine(self) -> None:
         """Runs the whole code management routine depending on the config
         supplied.
         """
-        logging.info("Running current code checking routine.")
-        logging.debug("Config: %s", self.config)
+        self.run_checks()
+        self.run_pipeline()
+
+    def run_checks(self) -> None:
+        """Runs the tests and the read-only checks in parallel, exiting if
+        the tests or the security check fail. Nothing in the project is
+        modified by this stage.
+        """
+        logger.info("Running current code checking routine.")
+        logger.debug("Config: %s", self.config)
         tests = self.config.tests
 
-        if tests is not None:
+        workers = len(self._checks) + 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            test_run = pool.submit(self.test_code, tests) if tests else None
+            futures = [pool.submit(func, arg) for arg, func in self._checks]
+
+            if test_run is not None:
+                try:
+                    test_run.result()
+                except SystemError as s:
+                    logger.critical(s)
+                    logger.critical("Code failed tests. Exiting.")
+                    # Drop any checks that haven't started yet before exiting.
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    sys.exit()
+
             try:
-                self.test_code(tests)  # type: ignore
+                for future in as_completed(futures):
+                    future.result()
             except SystemError as s:
-                logging.critical(s)
-                logging.critical("Code failed tests. Exiting.")
+                logger.critical(s)
+                logger.critical("Code failed the security check. Exiting.")
+                pool.shutdown(wait=False, cancel_futures=True)
                 sys.exit()
 
-        type_checking = self.config.type_checking
-        if type_checking is not None:
-            self.type_check_code()
-
-        lint = self.config.linting
-        if lint is not None:
-            self.lint_code(lint)
-
-        formatter = self.config.formatter
-        if self.config.format_code and formatter:
-            self.format_code(formatter)
-
-        if self.package_manager is not None:
-            self.generate_requirements()
+    def run_pipeline(self) -> None:
+        """Runs the stages that write to the project, such as formatting and
+        requirement generation, in order.
+        """
+        for arg, func in self._pipeline:
+            func(arg)
 
     def test_code(self, module: Literal["Unittest", "Pytest"]) -> None:
         """Functions tests with given framework and cancel script if they
@@ -288,13 +528,13 @@ class CodeManagement:
         if module == "Unittest":
             return
 
-        cmd = "pytest tests -v"
+        cmd = ["pytest", "tests", "-v"]
         if self.package_manager == "Poetry":
-            cmd = "poetry run " + cmd
-        output = util.run_sub_command(cmd)
-
-        if "failed" in output:
-            raise SystemError("All or some of the tests failed.")
+            cmd = ["poetry", "run", *cmd]
+        with closing(util.run_sub_command_stream(cmd, self.path)) as output:
+            for line in output:
+                if "failed" in line:
+                    raise SystemError("All or some of the tests failed.")
 
         return
 
@@ -307,16 +547,16 @@ class CodeManagement:
             linter (str): Chosen linter for checkign the code.
         """
         if linter == "Flake8":
-            cmd = f"flake8 .\\{self.code_location}\\"
+            cmd = ["flake8", self._target]
         elif linter == "Ruff":
-            cmd = f"ruff check .\\{self.code_location}\\"
+            cmd = ["ruff", "check", self._target]
         elif linter == "Pylint":
-            cmd = f"pylint .\\{self.code_location}\\"
+            cmd = ["pylint", self._target]
         else:
             # implementing the other linters at some other point
             return
 
-        util.run_sub_command(cmd)
+        util.run_sub_command(cmd, self.path)
 
     def format_code(self, formatter: Literal["Ruff", "Black"]) -> None:
         """Formats Code if the selected linter has the capability
@@ -325,21 +565,27 @@ class CodeManagement:
             formatter (str): Selected formatter for formatting the code.
         """
         if formatter == "Ruff":
-            cmd = f"ruff format .\\{self.code_location}\\"
+            cmd = ["ruff", "format", self._target]
         elif formatter == "Black":
-            cmd = f"black format .\\{self.code_location}\\"
+            cmd = ["black", self._target]
         else:
             return
 
-        util.run_sub_command(cmd)
+        util.run_sub_command(cmd, self.path)
+
+    def ruff_code(self) -> None:
+        """Formats and then lints the code with Ruff as one stage, so the
+        linter doesn't flag anything the formatter has already fixed.
+        """
+        self.format_code("Ruff")
+        self.lint_code("Ruff")
 
     def type_check_code(self) -> None:
         """Type checks code with MyPy and cancels if needed. Use mypy if
         available.
         """
-        code_location = self.config.main_code
-        cmd = f"mypy .\\{code_location}\\"
-        util.run_sub_command(cmd)
+        cmd = ["mypy", self._target]
+        util.run_sub_command(cmd, self.path)
 
     def generate_requirements(self) -> None:
         """Creates a requirement file or equivalent depending on the package
@@ -349,16 +595,20 @@ class CodeManagement:
              export multiple types of req files.
         """
         if self.package_manager == "Poetry":
-            cmd = "poetry lock"
+            cmd = ["poetry", "lock"]
         elif self.package_manager == "Conda":
             # Conda Enviroment name should be adjustable in the config.
-            cmd = "conda .conda export environment.yml"
+            cmd = ["conda", "env", "export", "--file", "environment.yml"]
         elif self.package_manager == "PIP":
-            cmd = "pip freeze > requirements.txt"
+            # No shell to redirect with, so the output is written here.
+            cmd = ["pip", "freeze"]
+            output = util.run_sub_command(cmd, self.path, echo=False)
+            (self.path / "requirements.txt").write_bytes(output)
+            return
         else:
             return
 
-        util.run_sub_command(cmd)
+        util.run_sub_command(cmd, self.path)
 
     def security_check(self, checker: Literal["Bandit"] = "Bandit") -> None:
         """Checks the code for security issues with the chosen provider.
@@ -370,15 +620,15 @@ class CodeManagement:
             SystemError: If the security issues are to severe.
         """        
         if checker == "Bandit":
-            cmd = f"bandit .\\{self.code_location}\\"
+            cmd = ["bandit", "-r", self._target]
         else:
             return
 
-        output = util.run_sub_command(cmd)
-
         # This should be configurable in the future.
-        if any(f"Severity: {x}" in output for x in self.SEVERITY_MATCH):
-            raise SystemError("Security are are to high.")
+        with closing(util.run_sub_command_stream(cmd, self.path)) as output:
+            for line in output:
+                if SEVERITY_PATTERN.search(line):
+                    raise SystemError("Security are are to high.")
 
 
 def main(*argvs):
@@ -386,7 +636,8 @@ def main(*argvs):
 
     >>> 0a. Configuration -> API, Working Directory
         0b. Check if the current directory is a git repo.
-    >>> 1. This needs to pull the current tracker.
+    >>> 1. This needs to pull the current tracker, which happens in the
+        background while the code is checked.
     >>> 2. Create config/docfiles such as requis/ Cancel Tracker
         2a. Check directory for env type and if it contains a req file or
             poetry file / conda env
@@ -396,49 +647,85 @@ def main(*argvs):
         3b. Possibly add files to repo here in the future.
     >>> 4. End the TGGL Tracker
     """
-    new_config = len(argvs) > 1 and argvs[1] in {"--new_config", "-nc"}
+    flag = argvs[1] if len(argvs) > 1 else None
+    new_config = flag in {"--new_config", "-nc"}
+
+    if flag in {"--dump_config", "-dc"}:
+        # Readable view of the compact file, which is left untouched.
+        try:
+            config_manager = ConfigManager()
+        except (FileNotFoundError, ValueError):
+            logger.critical("No valid configuration to dump.")
+            sys.exit()
+        data = util.json_loads(util.json_dumps(config_manager.config))
+        # Credentials are only base64 encoded, so they are never shown.
+        user_data = data["toggl"]["user_data"]
+        for key in ("password", "api_key"):
+            if user_data.get(key) is not None:
+                user_data[key] = "***"
+        print(util.json_dumps(data, indent=True).decode())
+        return
+
+    try:
+        config_manager = ConfigManager(load=not new_config)
+    except (FileNotFoundError, ValueError):
+        logger.warning("No valid configuration detected.")
+        config_manager = ConfigManager(load=False)
+        new_config = True
+
+    if new_config:
+        config_manager.bootstrap_interactive()
 
-    config_manager = ConfigManager(new_config)
     config = config_manager.config
+    git_conf, toggl_conf = config.git, config.toggl
+    do_add, do_commit, do_push = git_conf.add, git_conf.commit, git_conf.push
+    do_cancel, project = toggl_conf.cancel, toggl_conf.project
 
     repo_path = config.target_directory
     if not repo_path.exists():
-        logging.critical("Specfied repo folder does not exist.")
+        logger.critical("Specfied repo folder does not exist.")
         sys.exit()
 
     git_obj = GitManagement(repo_path)
 
     if not git_obj.check_git_repo():
-        logging.critical("Specified folder is not a GIT repo.")
+        logger.critical("Specified folder is not a GIT repo.")
         sys.exit()
 
-    tggl_api = TgglApi(config.toggl)
-
-    try:
-        entry = tggl_api.grab_tggl_time_entry(config.toggl.project)
-    except ConnectionError:
-        logging.critical("Failed to grab the current tggl entry.")
-        sys.exit()
-    except NotTrackingerror:
-        logging.critical("User is not tracking a time entry atm.")
-        sys.exit()
+    with TgglApi(toggl_conf) as tggl_api, ThreadPoolExecutor(1) as pool:
+        # The time entry is fetched while the read-only checks run, but has
+        # to resolve before anything in the project gets rewritten.
+        entry_request = pool.submit(tggl_api.grab_tggl_time_entry, project)
 
-    logging.info("Current time entry name is: %s", {entry.description})
+        code_obj = CodeManagement(config.python, repo_path)
+        code_obj.run_checks()
 
-    code_obj = CodeManagement(config.python, repo_path)
-    code_obj.run_management_routine()
+        try:
+            entry = entry_request.result()
+        except ConnectionError:
+            logger.critical("Failed to grab the current tggl entry.")
+            sys.exit()
+        except NotTrackingerror:
+            logger.critical("User is not tracking a time entry atm.")
+            sys.exit()
 
-    if config.git.add:
-        git_obj.add_files()
+        code_obj.run_pipeline()
 
-    if config.git.commit:
-        git_obj.create_commit(entry.description)
+        logger.info("Current time entry name is: %s", entry.description)
 
-    if config.git.push:
-        git_obj.push_to_remote_repo()
+        try:
+            git_obj.commit_and_push(
+                entry.description,
+                add=do_add,
+                commit=do_commit,
+                push=do_push,
+            )
+        except NotAGitRepoError:
+            logger.critical("Specified folder is not a GIT repo.")
+            sys.exit()
 
-    if config.toggl.cancel:
-        tggl_api.stop_tggl_time_entry(entry.workspace_id, entry.entry_id)
+        if do_cancel:
+            tggl_api.stop_tggl_time_entry(entry.workspace_id, entry.entry_id)
 
 
 if __name__ == "__main__":
@@ -446,6 +733,6 @@ if __name__ == "__main__":
     FMT += " %(message)s"
     logging.basicConfig(format=FMT, level=logging.INFO)
 
-    logging.info(APP_NAME.upper())
+    logger.info(APP_NAME.upper())
 
-    main(sys.argv)
+    main(*sys.argv)
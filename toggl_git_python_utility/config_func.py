@@ -1,6 +1,7 @@
 """Configuration setup dialogs and helper functions."""
 
 from typing import (
+    Callable,
     Literal,
     Optional,
     get_args,
@@ -13,11 +14,8 @@ import os
 import logging
 import base64
 import re
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from pathlib import Path
-import json
-
-import maskpass
 
 if __name__ == "__main__":
     root_path = Path(__file__).parent.resolve().parents[0]
@@ -26,8 +24,14 @@ if __name__ == "__main__":
 
 from toggl_git_python_utility import util
 
+logger = logging.getLogger(__name__)
+
+EMAIL_PATTERN = re.compile(
+    r"([A-Za-z0-9]+[._-])*[A-Za-z0-9]+@[A-Za-z0-9-]+(\.[A-Za-z]{2,})+"
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class PythonConfig:
     """Holds configuration for python code management."""
 
@@ -45,7 +49,7 @@ class PythonConfig:
         self.main_code = Path(self.main_code)
 
 
-@dataclass
+@dataclass(slots=True)
 class GitConfig:
     """Holds configuration settings for git code management."""
 
@@ -54,7 +58,7 @@ class GitConfig:
     push: bool = field(default=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class TogglAuth:
     """Authentication information for Toggl Tracker."""
 
@@ -63,7 +67,7 @@ class TogglAuth:
     api_key: Optional[str] = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class TogglConfig:
     """Configuration information for Toggl management."""
 
@@ -72,7 +76,7 @@ class TogglConfig:
     cancel: bool = field(default=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigModel:
     """Base Config items including the original target_directory."""
 
@@ -85,93 +89,103 @@ class ConfigModel:
         self.target_directory = Path(self.target_directory)
 
 
+def build_config(data: dict[str, Any]) -> ConfigModel:
+    """Builds the config model from loaded configuration data.
+    >>> Written out for the fixed schema, so loading doesn't need to walk the
+        annotations like generate_config does. Has to be kept in line with
+        the dataclasses above.
+    """
+    toggl = data["toggl"]
+    return ConfigModel(
+        target_directory=data["target_directory"],
+        python=PythonConfig(**data["python"]),
+        git=GitConfig(**data["git"]),
+        toggl=TogglConfig(
+            user_data=TogglAuth(**toggl["user_data"]),
+            project=toggl.get("project"),
+            cancel=toggl.get("cancel", False),
+        ),
+    )
+
+
+CONFIG_MODELS = frozenset(
+    {TogglConfig, TogglAuth, PythonConfig, GitConfig, ConfigModel}
+)
+
+# Prompt dispatch for generate_config, called with the key and its default.
+KEY_HANDLERS: dict[str, Callable[[str, Any], Any]] = {
+    "username": lambda _key, _default: select_username(),
+    "password": lambda key, _default: select_password(key),
+    "api_key": lambda key, _default: select_password(key),
+}
+TYPE_HANDLERS: dict[Any, Callable[[str, Any], Any]] = {
+    bool: lambda _key, default: default,
+    Path: lambda key, _default: create_path(key),
+    int: lambda key, _default: select_int(key),
+}
+
+
 class ConfigManager:
-    """Class for managing basic configuration duties."""
+    """Class for managing basic configuration duties. Construction never
+    prompts the user, creating a new configuration is done explicitly with
+    bootstrap_interactive.
 
-    def __init__(self, new: bool = False):
-        self.config_folder = Path(r"toggl_git_python_utility\config")
-        self.config_file_path = self.config_folder / "configuration.json"
+    Args:
+        load (bool, optional): Loads the existing configuration straight
+            away. Defaults to True.
 
-        if self.config_file_path.exists() and not new:
-            self.load_config()
-            return
+    Raises:
+        FileNotFoundError: If loading and no configuration exists yet.
+        ValueError: If loading and the configuration is corrupted.
+    """
 
-        logging.warning("No Configuration Detected")
-        self.new_config()
+    def __init__(self, load: bool = True):
+        self.config_folder = Path(r"toggl_git_python_utility\config")
+        self.config_file_path = self.config_folder / "configuration.json"
 
         self.config: ConfigModel
 
+        if load:
+            self.load_config()
+
     def load_config(self):
-        """Loads the existing configuration. If one doesn't exist or is
-        corrupted. It starts creating a new one."""
-        logging.info("Loading Configuration")
+        """Loads the existing configuration. Raises FileNotFoundError if
+        there is no configuration yet and ValueError if it is corrupted."""
+        logger.info("Loading Configuration")
+        data = util.json_loads(self.config_file_path.read_bytes())
         try:
-            with self.config_file_path.open("r", encoding="utf-8") as configf:
-                data = json.load(configf)
-                self.config = self.generate_config(ConfigModel, data)
-        except json.JSONDecodeError:
-            self.new_config()
+            self.config = build_config(data)
+        except (KeyError, TypeError) as err:
+            raise ValueError("Configuration file is corrupted.") from err
 
-    def new_config(self):
+    def bootstrap_interactive(self):
         """Creates a new config with user input and defaults."""
         self.config = self.generate_config(ConfigModel)
 
-        logging.info("Writing New Configuration To Save Location.")
+        logger.info("Writing New Configuration To Save Location.")
 
-        conf = asdict(self.config)
-        with self.config_file_path.open("w", encoding="utf-8") as configfile:
-            configfile.write(json.dumps(conf, cls=util.CustomJSONEncoder))
+        self.config_file_path.write_bytes(util.json_dumps(self.config))
 
-    def generate_config(
-        self, config_model: type, convert: Optional[dict] = None
-    ) -> Any:
-        """Generates a json config or converts an existing one depending if a
-        convert was passed in or not."""
+    def generate_config(self, config_model: type) -> Any:
+        """Generates a new config model by prompting the user for each field,
+        recursing into nested config models."""
 
         config_an = util.all_annotations(config_model)
         defaults = util.collect_defaults(config_model)
 
-        if config_model not in {
-            TogglConfig,
-            TogglAuth,
-            PythonConfig,
-            GitConfig,
-            ConfigModel,
-            dict,
-        }:
-            if get_origin(config_model) == Union:
-                config_model = get_args(config_model)[0]
-            if get_origin(config_model) is Literal:
-                config_model = str
-
-            return config_model(convert)
-
         data = {}
         for k, v in config_an.items():
             item = v
-            default = defaults[k]
-            origin = get_origin(item)
-
-            if origin == Union:
+            if get_origin(item) == Union:
                 item = get_args(item)[0]
 
-            d = v
-            if convert:
-                d = self.generate_config(v, convert.get(k))
-            elif item == bool:
-                d = default
-            elif item == Path:
-                d = create_path(k)
-            elif item in {TogglConfig, TogglAuth, PythonConfig, GitConfig}:
-                d = self.generate_config(v)
-            elif k in {"password", "api_key"}:
-                d = select_password(k)
-            elif k == "username":
-                d = select_username()
+            if item in CONFIG_MODELS:
+                d = self.generate_config(item)
             elif get_origin(item) is Literal:
-                d = select_option(k, item, default)
-            elif item == int:
-                d = select_int(k)
+                d = select_option(k, item, defaults.get(k))
+            else:
+                handler = KEY_HANDLERS.get(k) or TYPE_HANDLERS.get(item)
+                d = handler(k, defaults.get(k)) if handler is not None else v
 
             data[k] = d
 
@@ -241,15 +255,13 @@ def select_username() -> str:
         future.
     """
     util.create_seperator()
-    patt = r"([A-Za-z0-9]+[.-_])*[A-Za-z0-9]+@[A-Za-z0-9-]+(\.[A-Z|a-z]{2,})+"
-    pattern = re.compile(patt)
 
     print("Input a username(email) for your Toggl account.")
 
     while True:
         email = input("> ")
 
-        if re.fullmatch(pattern, email):
+        if EMAIL_PATTERN.fullmatch(email):
             return email
 
         print("Wrong Email Format! Try Again.")
@@ -262,6 +274,8 @@ def select_password(key: str) -> str:
     >>> Might have to look for a better storage solution as well.
     """
 
+    import maskpass
+
     util.create_seperator()
     key = key.replace("_", " ").title()
     print(f"Type in your {key} for your Toggle Account")
@@ -294,4 +308,8 @@ if __name__ == "__main__":
     FMT = "%(asctime)s | %(module)s@%(funcName)s:%(lineno)d | %(levelname)s ->"
     FMT += " %(message)s"
     logging.basicConfig(format=FMT, level=logging.INFO)
-    config = ConfigManager()
+    try:
+        config = ConfigManager()
+    except (FileNotFoundError, ValueError):
+        config = ConfigManager(load=False)
+        config.bootstrap_interactive()
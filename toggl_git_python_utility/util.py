@@ -1,78 +1,190 @@
 from pathlib import Path
 
 
-from dataclasses import _MISSING_TYPE, is_dataclass
-from typing import Any, NamedTuple
+from dataclasses import _MISSING_TYPE, fields, is_dataclass
+from typing import (
+    Any,
+    Generator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    get_type_hints,
+)
 import json
 
-from collections import ChainMap, defaultdict
+from functools import lru_cache
+from types import MappingProxyType
 
 import subprocess
 import shutil
-
-
-def run_sub_command(cmd: str) -> str:
-    """Runs the current provided command and prints/returns the out"""
-    width, _ = shutil.get_terminal_size(fallback=(80, 24))
-    print("Subprocess".center(width, "+"))
-    print(cmd)
-    run = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    print(run.stdout)
-    create_seperator("+")
-    return run.stdout
-
-
-def all_annotations(cls: Any) -> ChainMap:
+import shlex
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Keeps output of commands running in parallel threads from interleaving.
+OUTPUT_LOCK = threading.Lock()
+
+# Looked up once as the width doesn't change during a run.
+TERMINAL_WIDTH, _ = shutil.get_terminal_size(fallback=(80, 24))
+SUBPROCESS_HEADER = "Subprocess".center(TERMINAL_WIDTH, "+")
+
+
+def run_sub_command(
+    cmd: Sequence[str],
+    cwd: Optional[Path] = None,
+    *,
+    echo: bool = True,
+) -> bytes:
+    """Runs the current provided command and prints/returns the raw output.
+    The argument list is executed directly without going through a shell and
+    the command runs inside cwd if one is supplied. The output is only
+    decoded when echo is enabled."""
+    return run_sub_process(cmd, cwd, echo=echo).stdout
+
+
+def run_sub_process(
+    cmd: Sequence[str],
+    cwd: Optional[Path] = None,
+    *,
+    echo: bool = True,
+) -> subprocess.CompletedProcess:
+    """Same as run_sub_command, but returns the completed process so the
+    exit code and stderr can be inspected as well."""
+    run = subprocess.run(cmd, capture_output=True, check=False, cwd=cwd)
+    if not echo:
+        return run
+
+    with OUTPUT_LOCK:
+        print(SUBPROCESS_HEADER)
+        print(shlex.join(cmd))
+        print(run.stdout.decode(errors="replace"))
+        create_seperator("+")
+    return run
+
+
+def run_sub_command_stream(
+    cmd: Sequence[str],
+    cwd: Optional[Path] = None,
+) -> Generator[str, None, None]:
+    """Runs the current provided command and yields the output line by line
+    while it runs. The output is printed as one block once the command
+    finishes, so commands running in parallel don't interleave. Closing the
+    generator early terminates the process, so wrap it in contextlib.closing
+    when breaking out of the loop."""
+    lines: list[str] = []
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        errors="replace",
+        bufsize=1,
+        cwd=cwd,
+    ) as proc:
+        try:
+            for line in proc.stdout:  # type: ignore[union-attr]
+                lines.append(line)
+                yield line
+        finally:
+            if proc.poll() is None:
+                proc.terminate()
+            with OUTPUT_LOCK:
+                print(SUBPROCESS_HEADER)
+                print(shlex.join(cmd))
+                print("".join(lines), end="")
+                create_seperator("+")
+
+
+def all_annotations(cls: Any) -> MappingProxyType:
     """
-    >>> Returns a dictionary-like ChainMap that includes annotations for all
+    >>> Returns a read-only mapping that includes annotations for all
        attributes defined in cls or inherited from superclasses.
+    >>> Results are cached per class, so each class is only walked once.
     """
     if not isinstance(cls, type):
         cls = cls.__class__
-    anno = {}
-    for c in reversed(cls.__mro__):
-        if "__annotations__" in c.__dict__:
-            for key, val in c.__annotations__.items():
-                if key in anno:
-                    continue
-                anno[key] = val
+    return class_annotations(cls)
+
 
-    return ChainMap(anno)
+@lru_cache(maxsize=None)
+def class_annotations(cls: type) -> MappingProxyType:
+    """Cached implementation of all_annotations for classes. Resolves string
+    annotations as well through typing.get_type_hints."""
+    return MappingProxyType(get_type_hints(cls))
 
 
-def collect_defaults(cls: type) -> defaultdict:
+def collect_defaults(cls: Any) -> MappingProxyType:
     """Collects default values of a Dataclass Class and replaces them with
-    None if needed."""
+    None if needed. Results are cached per class."""
     if not isinstance(cls, type):
         cls = cls.__class__
+    return class_defaults(cls)
 
-    defaults: defaultdict[str, Any] = defaultdict(lambda: None)
+
+@lru_cache(maxsize=None)
+def class_defaults(cls: type) -> MappingProxyType:
+    """Cached implementation of collect_defaults for classes."""
+    defaults: dict[str, Any] = {}
 
     if "__dataclass_fields__" not in cls.__dict__:
-        return defaults
+        return MappingProxyType(defaults)
 
-    fields = cls.__dataclass_fields__  # type: ignore
+    dataclass_fields = cls.__dataclass_fields__  # type: ignore
 
-    for k, v in fields.items():
+    for k, v in dataclass_fields.items():
         default = v.default
         if isinstance(default, _MISSING_TYPE):
             default = None
 
         defaults[k] = default
 
-    return defaults
+    return MappingProxyType(defaults)
 
 
 def create_seperator(symbol: str = "#"):
-    w, _ = shutil.get_terminal_size()
-    print(symbol.center(w, symbol))
+    print(symbol.center(TERMINAL_WIDTH, symbol))
+
+
+def json_loads(data: bytes) -> Any:
+    """Parses JSON with orjson if it is installed else the json module."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Path):
-            return str(obj)
-        return super().default(obj)
+def json_default(obj: Any) -> Any:
+    """Converts objects the JSON libraries can't serialize. Dataclasses are
+    flattened one level at a time and paths are stored as strings.
+
+    Raises:
+        TypeError: If the object is of any other type.
+    """
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON "
+                    "serializable")
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serializes to newline terminated JSON with orjson if it is installed
+    else the json module. Output is compact unless indent is set."""
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=json_default, option=option)
+
+    if indent:
+        data = json.dumps(obj, default=json_default, indent=2)
+    else:
+        data = json.dumps(obj, default=json_default, separators=(",", ":"))
+    return (data + "\n").encode("utf-8")
 
 
 if __name__ == "__main__":